@@ -6,17 +6,28 @@ Autor: OpenCode
 
 import sys
 import os
+import argparse
 
 # Agregar el directorio src al path para poder importar módulos
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
 
 from ui.main_window import MainWindow
+from src.core import profiler
 from PyQt6.QtWidgets import QApplication
 
 
 def main():
     """Función principal para ejecutar la aplicación"""
-    app = QApplication(sys.argv)
+    parser = argparse.ArgumentParser(description="YouTube Downloader")
+    parser.add_argument('--profile', nargs='?', const='profiles', metavar='DIR',
+                        help="Perfilar hilos y GUI y guardar los resultados en DIR (por defecto: profiles)")
+    args, qt_args = parser.parse_known_args()
+    
+    if args.profile:
+        session_dir = profiler.enable(args.profile)
+        print(f"Modo de perfilado activo: {session_dir}")
+    
+    app = QApplication(sys.argv[:1] + qt_args)
     
     # Configurar aplicación
     app.setApplicationName("YouTube Downloader")
@@ -28,7 +39,14 @@ def main():
     window.show()
     
     # Ejecutar bucle de eventos
-    sys.exit(app.exec())
+    profiler.start_event_loop_monitor()
+    with profiler.profile_thread("MainWindow"):
+        exit_code = app.exec()
+    
+    summary_path = profiler.write_summary()
+    if summary_path:
+        print(f"Informe de perfilado: {summary_path}")
+    sys.exit(exit_code)
 
 
 if __name__ == "__main__":
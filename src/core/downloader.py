@@ -4,6 +4,8 @@ from PyQt6.QtCore import QThread, pyqtSignal
 import yt_dlp
 from yt_dlp import DownloadError
 
+from src.core import profiler
+
 
 class VideoDownloader(QThread):
     progress_updated = pyqtSignal(int)
@@ -25,8 +27,12 @@ class VideoDownloader(QThread):
         """Método para cancelar la descarga"""
         self._is_cancelled = True
         self.log_updated.emit("Cancelando descarga...")
-        self.terminate()  # Forzar terminación del hilo
+        # Al perfilar, terminate() dejaría una pila colgante que el muestreo no
+        # puede leer; progress_hook interrumpe la descarga en su lugar
+        if not profiler.is_enabled():
+            self.terminate()  # Forzar terminación del hilo
         
+    @profiler.profiled("VideoDownloader.run")
     def run(self):
         try:
             if self._is_cancelled:
@@ -74,20 +80,31 @@ class VideoDownloader(QThread):
                 duration = info.get('duration', 0)
                 self.log_updated.emit(f"Duración: {self.format_duration(duration)}")
             
+            if self._is_cancelled:
+                return
+            
             # Descargar el video
             with yt_dlp.YoutubeDL(self.ydl_opts) as ydl:
                 ydl.download([self.url])
             
+            if self._is_cancelled:
+                return
+            
             self.log_updated.emit("¡Descarga completada!")
             self.progress_updated.emit(100)
             self.finished.emit()
             
         except DownloadError as e:
-            self.error_occurred.emit(f"Error de descarga: {str(e)}")
+            if not self._is_cancelled:
+                self.error_occurred.emit(f"Error de descarga: {str(e)}")
         except Exception as e:
-            self.error_occurred.emit(f"Error inesperado: {str(e)}")
+            if not self._is_cancelled:
+                self.error_occurred.emit(f"Error inesperado: {str(e)}")
     
     def progress_hook(self, d):
+        if self._is_cancelled:
+            raise DownloadError("Descarga cancelada")
+        
         if d['status'] == 'downloading':
             total_bytes = d.get('total_bytes') or d.get('total_bytes_estimate', 0)
             downloaded_bytes = d.get('downloaded_bytes', 0)
@@ -0,0 +1,271 @@
+import os
+import io
+import sys
+import time
+import threading
+import functools
+from collections import Counter, deque, defaultdict
+from PyQt6.QtCore import Qt, QTimer
+
+
+_session_dir = None
+_lock = threading.Lock()
+_sampler = None
+_signal_latencies = defaultdict(list)
+_event_loop_lags = []
+_heartbeat = None
+
+SAMPLE_INTERVAL = 0.005
+HEARTBEAT_INTERVAL_MS = 50
+
+
+class _ThreadStats:
+    """Muestras acumuladas de todas las ejecuciones con un mismo nombre"""
+
+    def __init__(self):
+        self.samples = 0
+        self.idle = 0
+        self.own = Counter()
+        self.cumulative = Counter()
+        self.stacks = Counter()
+        self.started = 0
+        self.finished = 0
+
+
+class _StackSampler(threading.Thread):
+    """Muestreo periódico de las pilas de los hilos registrados
+
+    A diferencia de cProfile, no depende de un perfilador por hilo (Python
+    3.12+ solo admite uno por proceso) y conserva las muestras de los hilos
+    detenidos con terminate().
+    """
+
+    def __init__(self, interval=SAMPLE_INTERVAL):
+        super().__init__(name="profiler-sampler", daemon=True)
+        self.interval = interval
+        self.stats = defaultdict(_ThreadStats)
+        # ident del hilo -> (nombre, marco que delimita la ejecución)
+        self.threads = {}
+        self._stop_event = threading.Event()
+
+    def register(self, name, frame):
+        with _lock:
+            self.threads[threading.get_ident()] = (name, frame)
+            self.stats[name].started += 1
+
+    def unregister(self, name):
+        with _lock:
+            self.threads.pop(threading.get_ident(), None)
+            self.stats[name].finished += 1
+
+    def stop(self):
+        self._stop_event.set()
+        self.join()
+
+    def run(self):
+        while not self._stop_event.wait(self.interval):
+            self.sample()
+
+    def sample(self):
+        frames = sys._current_frames()
+        with _lock:
+            for ident, (name, root) in list(self.threads.items()):
+                frame = frames.get(ident)
+                stack = []
+                while frame is not None and frame is not root:
+                    code = frame.f_code
+                    stack.append((os.path.basename(code.co_filename), code.co_firstlineno, code.co_name))
+                    frame = frame.f_back
+                if frame is None:
+                    # El hilo terminó sin pasar por unregister() (terminate())
+                    del self.threads[ident]
+                    continue
+
+                stats = self.stats[name]
+                stats.samples += 1
+                if not stack:
+                    # Ejecutando código C bajo el marco raíz, p. ej. esperando en exec()
+                    stats.idle += 1
+                    continue
+                stats.own[stack[0]] += 1
+                stats.cumulative.update(set(stack))
+                stats.stacks[";".join(f"{func} ({filename}:{line})" for filename, line, func in reversed(stack))] += 1
+
+
+def enable(output_dir="profiles"):
+    """Activar el modo de perfilado, crear el directorio de la sesión e iniciar el muestreo"""
+    global _session_dir, _sampler
+    _session_dir = os.path.join(output_dir, time.strftime("%Y%m%d-%H%M%S"))
+    os.makedirs(_session_dir, exist_ok=True)
+    _sampler = _StackSampler()
+    _sampler.start()
+    return _session_dir
+
+
+def is_enabled():
+    return _session_dir is not None
+
+
+class profile_thread:
+    """Registrar el hilo actual con un nombre mientras dura el bloque
+
+    Solo se muestrean las llamadas hechas desde el marco que abre el bloque.
+    """
+
+    def __init__(self, name):
+        self.name = name
+
+    def __enter__(self):
+        if is_enabled():
+            _sampler.register(self.name, sys._getframe(1))
+        return self
+
+    def __exit__(self, *exc_info):
+        if is_enabled():
+            _sampler.unregister(self.name)
+        return False
+
+
+def profiled(name):
+    """Decorador para perfilar el método run() de un hilo de trabajo"""
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            with profile_thread(name):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+def connect(signal, slot, name):
+    """Conectar una señal a un slot registrando la latencia emisión -> slot
+
+    Sin el modo de perfilado equivale a signal.connect(slot). Con él, se anota
+    el instante de cada emisión en el hilo emisor y se calcula la espera hasta
+    que el slot se ejecuta en el bucle de eventos de la GUI.
+    """
+    if not is_enabled():
+        signal.connect(slot)
+        return
+
+    emitted = deque()
+
+    def on_emit(*args):
+        emitted.append(time.perf_counter())
+
+    def on_slot(*args):
+        handled = time.perf_counter()
+        if emitted:
+            latency = handled - emitted.popleft()
+            with _lock:
+                _signal_latencies[name].append(latency)
+        slot(*args)
+
+    # Conexión directa: se ejecuta en el hilo que emite la señal
+    signal.connect(on_emit, type=Qt.ConnectionType.DirectConnection)
+    signal.connect(on_slot)
+
+
+def start_event_loop_monitor():
+    """Medir el retraso del bucle de eventos con un temporizador periódico"""
+    global _heartbeat
+    if not is_enabled():
+        return
+
+    last_tick = [time.perf_counter()]
+
+    def on_tick():
+        now = time.perf_counter()
+        lag = now - last_tick[0] - HEARTBEAT_INTERVAL_MS / 1000
+        last_tick[0] = now
+        _event_loop_lags.append(max(lag, 0.0))
+
+    _heartbeat = QTimer()
+    _heartbeat.setInterval(HEARTBEAT_INTERVAL_MS)
+    _heartbeat.timeout.connect(on_tick)
+    _heartbeat.start()
+
+
+def _latency_line(name, values):
+    values = sorted(values)
+    count = len(values)
+    mean = sum(values) / count
+    p95 = values[min(count - 1, int(count * 0.95))]
+    return (f"{name:<40} {count:>8} {mean * 1000:>10.2f} "
+            f"{p95 * 1000:>10.2f} {values[-1] * 1000:>10.2f}")
+
+
+def _hot_spots(title, counter, busy, top, report):
+    report.write(f"=== {title} (top {top}) ===\n")
+    report.write(f"{'muestras':>8} {'%':>6} {'~ms':>8}  función\n")
+    for (filename, line, func), count in counter.most_common(top):
+        report.write(f"{count:>8} {count * 100 / busy:>6.1f} {count * SAMPLE_INTERVAL * 1000:>8.0f}  "
+                     f"{func} ({filename}:{line})\n")
+    report.write("\n")
+
+
+def write_summary(top=25):
+    """Detener el muestreo, guardar las pilas por hilo y escribir el informe resumen"""
+    if not is_enabled():
+        return None
+    if _heartbeat is not None:
+        _heartbeat.stop()
+    _sampler.stop()
+
+    report = io.StringIO()
+    report.write(f"Sesión de perfilado: {_session_dir}\n")
+    report.write(f"Intervalo de muestreo: {SAMPLE_INTERVAL * 1000:.0f} ms\n\n")
+
+    with _lock:
+        running = Counter(name for name, _ in _sampler.threads.values())
+        all_stats = dict(_sampler.stats)
+
+    interrupted = {}
+    for name, stats in sorted(all_stats.items()):
+        # Pilas en formato "collapsed" (flamegraph.pl, speedscope)
+        with open(os.path.join(_session_dir, f"{name}.folded"), 'w', encoding='utf-8') as f:
+            for stack, count in stats.stacks.most_common():
+                f.write(f"{stack} {count}\n")
+
+        missing = stats.started - stats.finished - running[name]
+        if missing:
+            interrupted[name] = missing
+
+        busy = stats.samples - stats.idle
+        report.write(f"##### {name} ({stats.started} ejecuciones, {stats.samples} muestras, "
+                     f"{stats.idle} en espera) #####\n")
+        if busy:
+            _hot_spots("Funciones con más tiempo propio", stats.own, busy, top, report)
+            _hot_spots("Funciones con más tiempo acumulado", stats.cumulative, busy, top, report)
+        else:
+            report.write("Sin muestras activas\n\n")
+
+    if interrupted or running:
+        report.write("=== Ejecuciones sin terminar ===\n")
+        report.write("Interrumpidas con terminate() o aún activas al cerrar; sus muestras\n"
+                     "hasta ese momento están incluidas arriba.\n")
+        for name in sorted(set(interrupted) | set(running)):
+            report.write(f"{name:<40} interrumpidas: {interrupted.get(name, 0):>4}  "
+                         f"activas: {running.get(name, 0):>4}\n")
+        report.write("\n")
+
+    header = f"{'':<40} {'llamadas':>8} {'media ms':>10} {'p95 ms':>10} {'máx ms':>10}\n"
+    with _lock:
+        latencies = {name: list(values) for name, values in _signal_latencies.items()}
+        lags = list(_event_loop_lags)
+
+    report.write("=== Latencia señal -> slot en la GUI ===\n")
+    report.write(header)
+    for name, values in sorted(latencies.items()):
+        if values:
+            report.write(_latency_line(name, values) + "\n")
+
+    report.write("\n=== Retraso del bucle de eventos ===\n")
+    report.write(header)
+    if lags:
+        report.write(_latency_line("heartbeat", lags) + "\n")
+
+    summary_path = os.path.join(_session_dir, "summary.txt")
+    with open(summary_path, 'w', encoding='utf-8') as f:
+        f.write(report.getvalue())
+    return summary_path
@@ -0,0 +1,264 @@
+import os
+import time
+import threading
+from collections import OrderedDict
+from PyQt6.QtCore import QObject, QRunnable, QThreadPool, QTimer, QByteArray, QBuffer, QIODevice, Qt, pyqtSignal
+from PyQt6.QtGui import QImage, QPixmap
+import requests
+
+
+THUMBNAIL_SIZE = (96, 54)
+THUMBNAIL_URL = "https://i.ytimg.com/vi/{video_id}/mqdefault.jpg"
+RETRY_DELAYS = (5, 30, 120)
+DEFAULT_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "youtube_downloader", "thumbnails")
+
+
+class PixmapLRUCache:
+    """Caché en memoria de QPixmaps con política LRU (solo hilo de la GUI)"""
+
+    def __init__(self, capacity=256):
+        self.capacity = capacity
+        self._items = OrderedDict()
+
+    def get(self, key):
+        pixmap = self._items.get(key)
+        if pixmap is not None:
+            self._items.move_to_end(key)
+        return pixmap
+
+    def put(self, key, pixmap):
+        self._items[key] = pixmap
+        self._items.move_to_end(key)
+        while len(self._items) > self.capacity:
+            self._items.popitem(last=False)
+
+    def __contains__(self, key):
+        return key in self._items
+
+    def clear(self):
+        self._items.clear()
+
+
+class DiskThumbnailCache:
+    """Caché en disco de miniaturas ya reducidas, limitada en tamaño total"""
+
+    def __init__(self, cache_dir=DEFAULT_CACHE_DIR, max_bytes=50 * 1024 * 1024):
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._total_bytes = 0
+        # Sin directorio escribible se trabaja solo con la caché en memoria
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            self._total_bytes = sum(size for _, size, _ in self._scan())
+            self.available = True
+        except OSError:
+            self.available = False
+
+    def _path(self, video_id):
+        safe_id = "".join(c for c in video_id if c.isalnum() or c in "-_")
+        return os.path.join(self.cache_dir, f"{safe_id}.jpg")
+
+    def _scan(self):
+        entries = []
+        for name in os.listdir(self.cache_dir):
+            path = os.path.join(self.cache_dir, name)
+            try:
+                stat = os.stat(path)
+            except OSError:
+                continue
+            entries.append((path, stat.st_size, stat.st_mtime))
+        return entries
+
+    def get(self, video_id):
+        if not self.available:
+            return None
+        path = self._path(video_id)
+        try:
+            with open(path, 'rb') as f:
+                data = f.read()
+            # Actualizar la fecha de acceso para el orden LRU
+            os.utime(path)
+            return data
+        except OSError:
+            return None
+
+    def put(self, video_id, data):
+        if not self.available:
+            return
+        path = self._path(video_id)
+        with self._lock:
+            try:
+                previous = os.path.getsize(path) if os.path.exists(path) else 0
+                with open(path, 'wb') as f:
+                    f.write(data)
+            except OSError:
+                return
+            self._total_bytes += len(data) - previous
+            if self._total_bytes > self.max_bytes:
+                self._prune()
+
+    def _prune(self):
+        """Eliminar las miniaturas menos usadas hasta quedar bajo el límite"""
+        entries = sorted(self._scan(), key=lambda entry: entry[2])
+        self._total_bytes = sum(size for _, size, _ in entries)
+        target = self.max_bytes * 0.9
+        for path, size, _ in entries:
+            if self._total_bytes <= target:
+                break
+            try:
+                os.remove(path)
+                self._total_bytes -= size
+            except OSError:
+                continue
+
+
+class _ThumbnailSignals(QObject):
+    loaded = pyqtSignal(str, int, QImage)
+    failed = pyqtSignal(str, int)
+
+
+class _ThumbnailTask(QRunnable):
+    """Tarea en segundo plano: leer de disco o descargar, decodificar y reducir"""
+
+    def __init__(self, video_id, url, token, fetcher):
+        super().__init__()
+        self.video_id = video_id
+        self.url = url
+        self.token = token
+        self.disk_cache = fetcher.disk_cache
+        self.signals = fetcher._signals
+        self.is_wanted = fetcher._is_wanted
+
+    def run(self):
+        # Las solicitudes retiradas mientras esperaban en cola terminan sin trabajo
+        if not self.is_wanted(self.video_id, self.token):
+            return
+        try:
+            data = self.disk_cache.get(self.video_id)
+            if data is not None:
+                image = QImage.fromData(data)
+                if not image.isNull():
+                    self.signals.loaded.emit(self.video_id, self.token, image)
+                    return
+
+            if not self.is_wanted(self.video_id, self.token):
+                return
+            # Tiempos cortos para no retener el cierre de la aplicación
+            response = requests.get(self.url, timeout=(3, 5))
+            response.raise_for_status()
+            image = QImage.fromData(response.content)
+            if image.isNull():
+                self.signals.failed.emit(self.video_id, self.token)
+                return
+
+            image = image.scaled(THUMBNAIL_SIZE[0], THUMBNAIL_SIZE[1],
+                                 Qt.AspectRatioMode.KeepAspectRatio,
+                                 Qt.TransformationMode.SmoothTransformation)
+            # Guardar la versión reducida para no repetir la descarga
+            buffer_data = QByteArray()
+            buffer = QBuffer(buffer_data)
+            buffer.open(QIODevice.OpenModeFlag.WriteOnly)
+            image.save(buffer, "JPG", 85)
+            buffer.close()
+            self.disk_cache.put(self.video_id, bytes(buffer_data))
+
+            self.signals.loaded.emit(self.video_id, self.token, image)
+        except Exception:
+            self.signals.failed.emit(self.video_id, self.token)
+
+
+class ThumbnailFetcher(QObject):
+    """Carga concurrente y acotada de miniaturas con caché en memoria y en disco"""
+
+    thumbnail_ready = pyqtSignal(str, QPixmap)
+    retry_due = pyqtSignal()
+
+    def __init__(self, max_workers=4, memory_capacity=256, disk_cache=None, parent=None):
+        super().__init__(parent)
+        self.memory_cache = PixmapLRUCache(memory_capacity)
+        self.disk_cache = disk_cache or DiskThumbnailCache()
+        self.pool = QThreadPool()
+        self.pool.setMaxThreadCount(max_workers)
+        # video_id -> token de la solicitud vigente; los hilos lo consultan
+        self._pending = {}
+        self._pending_lock = threading.Lock()
+        # video_id -> (intentos fallidos, instante a partir del cual reintentar)
+        self._failed = {}
+        self._next_token = 0
+        self._signals = _ThumbnailSignals()
+        self._signals.loaded.connect(self._on_loaded)
+        self._signals.failed.connect(self._on_failed)
+
+    def cached(self, video_id):
+        """Obtener la miniatura desde memoria, o None si no está cargada"""
+        return self.memory_cache.get(video_id)
+
+    def request(self, video_id, url=None):
+        """Solicitar una miniatura; emite thumbnail_ready cuando está disponible"""
+        if not video_id or video_id in self._pending or not self._can_retry(video_id):
+            return
+        pixmap = self.memory_cache.get(video_id)
+        if pixmap is not None:
+            self.thumbnail_ready.emit(video_id, pixmap)
+            return
+        self._next_token += 1
+        with self._pending_lock:
+            self._pending[video_id] = self._next_token
+        url = url or THUMBNAIL_URL.format(video_id=video_id)
+        self.pool.start(_ThumbnailTask(video_id, url, self._next_token, self))
+
+    def retain(self, video_ids):
+        """Descartar las solicitudes pendientes que ya no son visibles"""
+        with self._pending_lock:
+            for video_id in [v for v in self._pending if v not in video_ids]:
+                del self._pending[video_id]
+
+    def cancel_pending(self):
+        """Descartar las solicitudes en cola (p. ej. al cambiar de playlist)"""
+        self.pool.clear()
+        with self._pending_lock:
+            self._pending.clear()
+        self._failed.clear()
+
+    def shutdown(self, timeout_ms=2000):
+        """Vaciar la cola y esperar un tiempo limitado a las tareas en curso"""
+        self.cancel_pending()
+        self.pool.waitForDone(timeout_ms)
+
+    def _can_retry(self, video_id):
+        failure = self._failed.get(video_id)
+        if failure is None:
+            return True
+        attempts, retry_at = failure
+        return attempts <= len(RETRY_DELAYS) and time.monotonic() >= retry_at
+
+    def _is_wanted(self, video_id, token):
+        with self._pending_lock:
+            return self._pending.get(video_id) == token
+
+    def _take(self, video_id, token):
+        with self._pending_lock:
+            if self._pending.get(video_id) != token:
+                return False
+            del self._pending[video_id]
+            return True
+
+    def _on_loaded(self, video_id, token, image):
+        pixmap = QPixmap.fromImage(image)
+        self.memory_cache.put(video_id, pixmap)
+        if self._take(video_id, token):
+            self._failed.pop(video_id, None)
+            self.thumbnail_ready.emit(video_id, pixmap)
+
+    def _on_failed(self, video_id, token):
+        if not self._take(video_id, token):
+            return
+        attempts = self._failed.get(video_id, (0, 0))[0] + 1
+        if attempts > len(RETRY_DELAYS):
+            # Sin más reintentos hasta que se recargue la playlist
+            self._failed[video_id] = (attempts, 0)
+            return
+        delay = RETRY_DELAYS[attempts - 1]
+        self._failed[video_id] = (attempts, time.monotonic() + delay)
+        QTimer.singleShot(int(delay * 1000), self.retry_due.emit)
@@ -5,10 +5,12 @@ from PyQt6.QtWidgets import (QApplication, QMainWindow, QWidget, QVBoxLayout,
                              QComboBox, QProgressBar, QTextEdit,
                              QGroupBox, QGridLayout, QMessageBox, QFileDialog,
                              QListWidget, QListWidgetItem)
-from PyQt6.QtCore import QThread, pyqtSignal, Qt
+from PyQt6.QtCore import QThread, pyqtSignal, Qt, QSize, QPoint, QTimer
 from PyQt6.QtGui import QFont, QIcon
 
 from src.core.downloader import VideoDownloader
+from src.core.thumbnails import ThumbnailFetcher, THUMBNAIL_SIZE
+from src.core import profiler
 import yt_dlp
 from yt_dlp import DownloadError
 
@@ -20,7 +22,15 @@ class PlaylistLoader(QThread):
     def __init__(self, url):
         super().__init__()
         self.url = url
+        self._is_cancelled = False
         
+    def cancel(self):
+        """Cancelar la carga; al perfilar se deja terminar y se descarta el resultado"""
+        self._is_cancelled = True
+        if not profiler.is_enabled():
+            self.terminate()
+        
+    @profiler.profiled("PlaylistLoader.run")
     def run(self):
         try:
             ydl_opts = {
@@ -34,6 +44,9 @@ class PlaylistLoader(QThread):
             with yt_dlp.YoutubeDL(ydl_opts) as ydl:
                 info = ydl.extract_info(self.url, download=False)
                 
+                if self._is_cancelled:
+                    return
+                
                 if 'entries' in info:
                     videos = []
                     entries = info.get('entries', [])
@@ -77,8 +90,17 @@ class MainWindow(QMainWindow):
         self.videos = []
         self.is_playlist = False
         self.playlist_loader = None
+        self.retired_threads = []
         self.current_download_index = 0
         
+        # Miniaturas: carga concurrente limitada a las filas visibles
+        self.thumbnail_fetcher = ThumbnailFetcher(parent=self)
+        self.thumbnail_fetcher.thumbnail_ready.connect(self.on_thumbnail_ready)
+        self.thumbnail_fetcher.retry_due.connect(self.schedule_thumbnail_load)
+        self.thumbnail_rows = {}
+        self.visible_rows = set()
+        self.icon_rows = set()
+        
         # Usar colores del sistema operativo
         self.setStyleSheet("")
         
@@ -162,6 +184,8 @@ class MainWindow(QMainWindow):
         self.video_list = QListWidget()
         self.video_list.itemChanged.connect(self.on_video_item_changed)
         self.video_list.setMaximumHeight(200)
+        self.video_list.setIconSize(QSize(*THUMBNAIL_SIZE))
+        self.video_list.verticalScrollBar().valueChanged.connect(self.schedule_thumbnail_load)
         playlist_layout.addWidget(self.video_list)
         
         self.playlist_group.setLayout(playlist_layout)
@@ -219,6 +243,12 @@ class MainWindow(QMainWindow):
         log_group.setLayout(log_layout)
         layout.addWidget(log_group)
         
+        # Agrupar los eventos de scroll antes de pedir miniaturas
+        self.thumbnail_timer = QTimer(self)
+        self.thumbnail_timer.setSingleShot(True)
+        self.thumbnail_timer.setInterval(100)
+        self.thumbnail_timer.timeout.connect(self.load_visible_thumbnails)
+        
     def browse_folder(self):
         folder = QFileDialog.getExistingDirectory(self, "📂 Seleccionar carpeta de descarga")
         if folder:
@@ -236,6 +266,7 @@ class MainWindow(QMainWindow):
         self.selected_videos = []
         self.videos = []
         self.video_list.clear()
+        self.reset_thumbnails()
         self.playlist_group.setVisible(False)
         self.current_download_index = 0
         
@@ -289,12 +320,13 @@ class MainWindow(QMainWindow):
     
     def start_download_thread(self):
         """Iniciar el hilo de descarga"""
-        self.downloader_thread.progress_updated.connect(self.update_progress)
-        self.downloader_thread.log_updated.connect(self.log_message)
-        self.downloader_thread.finished.connect(self.on_video_finished)
-        self.downloader_thread.error_occurred.connect(self.on_video_error)
-        self.downloader_thread.speed_updated.connect(self.update_speed)
-        self.downloader_thread.eta_updated.connect(self.update_eta)
+        thread = self.downloader_thread
+        profiler.connect(thread.progress_updated, self.update_progress, "progress_updated")
+        profiler.connect(thread.log_updated, self.log_message, "log_updated")
+        profiler.connect(thread.finished, self.on_video_finished, "finished")
+        profiler.connect(thread.error_occurred, self.on_video_error, "error_occurred")
+        profiler.connect(thread.speed_updated, self.update_speed, "speed_updated")
+        profiler.connect(thread.eta_updated, self.update_eta, "eta_updated")
         
         self.progress_bar.setVisible(True)
         self.progress_bar.setValue(0)
@@ -351,6 +383,7 @@ class MainWindow(QMainWindow):
                 
                 # Esperar a que el hilo termine
                 self.downloader_thread.wait(3000)  # Esperar máximo 3 segundos
+                self.retire_thread(self.downloader_thread)
                 
                 # Restablecer interfaz
                 self.log_message("Descarga cancelada por el usuario")
@@ -391,6 +424,7 @@ class MainWindow(QMainWindow):
         if url != getattr(self, '_last_url', ''):
             self.videos = []
             self.video_list.clear()
+            self.reset_thumbnails()
             self.playlist_group.setVisible(False)
             self.is_playlist = False
             self._last_url = url
@@ -405,14 +439,22 @@ class MainWindow(QMainWindow):
         
         # Cancelar loader anterior si existe
         if self.playlist_loader and self.playlist_loader.isRunning():
-            self.playlist_loader.terminate()
-            self.playlist_loader.wait()
+            self.playlist_loader.cancel()
+            if not profiler.is_enabled():
+                self.playlist_loader.wait()
+            self.retire_thread(self.playlist_loader)
         
         self.playlist_loader = PlaylistLoader(url)
-        self.playlist_loader.videos_loaded.connect(self.on_playlist_loaded)
-        self.playlist_loader.error_occurred.connect(self.on_playlist_error)
+        profiler.connect(self.playlist_loader.videos_loaded, self.on_playlist_loaded, "videos_loaded")
+        profiler.connect(self.playlist_loader.error_occurred, self.on_playlist_error, "playlist_error")
         self.playlist_loader.start()
     
+    def retire_thread(self, thread):
+        """Conservar la referencia a un hilo cancelado hasta que termine"""
+        self.retired_threads = [t for t in self.retired_threads if t.isRunning()]
+        if thread.isRunning():
+            self.retired_threads.append(thread)
+    
     def on_playlist_loaded(self, videos):
         """Manejar videos cargados de la playlist"""
         self.is_playlist = True
@@ -433,19 +475,85 @@ class MainWindow(QMainWindow):
     def populate_video_list(self):
         """Llenar la lista de videos"""
         self.video_list.clear()
+        self.reset_thumbnails()
         
-        for video in self.videos:
+        for row, video in enumerate(self.videos):
             item = QListWidgetItem()
             item.setText(f"📹 {video['index']:3d}. {video['title'][:60]}... ({video['duration']})")
             item.setData(Qt.ItemDataRole.UserRole, video)
             item.setFlags(item.flags() | Qt.ItemFlag.ItemIsUserCheckable)
             item.setCheckState(Qt.CheckState.Checked)
             
+            # Un mismo video puede aparecer varias veces en la playlist
+            if video['id']:
+                self.thumbnail_rows.setdefault(video['id'], []).append(row)
+            
             self.video_list.addItem(item)
         
         # Mostrar grupo de playlist
         self.playlist_group.setVisible(True)
         self.update_video_count()
+        self.schedule_thumbnail_load()
+    
+    def schedule_thumbnail_load(self, *args):
+        """Programar la carga de miniaturas tras un breve intervalo"""
+        self.thumbnail_timer.start()
+    
+    def reset_thumbnails(self):
+        """Olvidar las filas de la lista anterior y descartar solicitudes en cola"""
+        self.thumbnail_rows = {}
+        self.visible_rows = set()
+        self.icon_rows = set()
+        self.thumbnail_fetcher.cancel_pending()
+    
+    def set_row_icon(self, row, icon):
+        """Asignar un icono sin disparar itemChanged (y el recuento de selección)"""
+        self.video_list.blockSignals(True)
+        self.video_list.item(row).setIcon(icon)
+        self.video_list.blockSignals(False)
+    
+    def load_visible_thumbnails(self):
+        """Mostrar miniaturas solo en las filas visibles y liberar las demás"""
+        count = self.video_list.count()
+        if not count or not self.thumbnail_rows:
+            return
+        
+        viewport = self.video_list.viewport()
+        first = self.video_list.indexAt(QPoint(0, 0)).row()
+        last = self.video_list.indexAt(QPoint(0, viewport.height() - 1)).row()
+        if first < 0:
+            return
+        if last < 0:
+            last = count - 1
+        self.visible_rows = set(range(first, last + 1))
+        
+        # Quitar los iconos fuera de la vista: solo la caché LRU retiene pixmaps
+        for row in self.icon_rows - self.visible_rows:
+            self.set_row_icon(row, QIcon())
+        self.icon_rows &= self.visible_rows
+        
+        visible_ids = set()
+        for row in sorted(self.visible_rows):
+            video = self.video_list.item(row).data(Qt.ItemDataRole.UserRole)
+            if video['id']:
+                visible_ids.add(video['id'])
+        
+        self.thumbnail_fetcher.retain(visible_ids)
+        for video_id in visible_ids:
+            pixmap = self.thumbnail_fetcher.cached(video_id)
+            if pixmap is not None:
+                self.on_thumbnail_ready(video_id, pixmap)
+            else:
+                self.thumbnail_fetcher.request(video_id)
+    
+    def on_thumbnail_ready(self, video_id, pixmap):
+        """Asignar la miniatura cargada a sus filas visibles"""
+        icon = None
+        for row in self.thumbnail_rows.get(video_id, []):
+            if row in self.visible_rows and row not in self.icon_rows:
+                icon = icon or QIcon(pixmap)
+                self.set_row_icon(row, icon)
+                self.icon_rows.add(row)
     
     def select_all_videos(self):
         """Seleccionar todos los videos"""
@@ -475,6 +583,15 @@ class MainWindow(QMainWindow):
         
         self.video_count_label.setText(f"{checked_count} videos seleccionados")
     
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        self.schedule_thumbnail_load()
+    
+    def closeEvent(self, event):
+        # No esperar a las miniaturas en cola al cerrar la ventana
+        self.thumbnail_fetcher.shutdown()
+        super().closeEvent(event)
+    
     def format_duration(self, seconds):
         """Formatear duración del video"""
         if not seconds: